@@ -32,6 +32,7 @@ class CoderConfig(Config):
     # Architecture
     activation: str = 'relu'
     normalization: str = 'layer'
+    mp_policy: str = 'float32'  # e.g. 'params=float32,compute=bfloat16'
 
     cnn_emb_dim: int = 64
     cnn_depths: Layers = (64, 64, 64, 64)
@@ -6,6 +6,7 @@ import jax
 import jax.numpy as jnp
 import chex
 import haiku as hk
+import jmp
 
 from src import types_ as types
 from src.config import CoderConfig
@@ -76,6 +77,10 @@ class Encoder(hk.Module):
         return emb(x)
 
 
+class QHead(hk.Linear):
+    """Final critic layer, kept apart to run in full precision."""
+
+
 class DQN(hk.Module):
 
     def __init__(self,
@@ -95,7 +100,7 @@ class DQN(hk.Module):
         chex.assert_type(state, float)
         x = MLP(self.layers, self.act, self.norm)(state)
         w_init = hk.initializers.TruncatedNormal(stddev=1e-2)
-        return hk.Linear(self.act_dim, w_init=w_init)(x)
+        return QHead(self.act_dim, w_init=w_init, name='linear')(x)
 
 
 class CriticsEnsemble(hk.Module):
@@ -137,6 +142,15 @@ class CoderNetworks(NamedTuple):
             lambda sp: sp.generate_value(),
             observation_spec
         )
+        # Policies are set per module class for the whole process.
+        policy = jmp.get_policy(cfg.mp_policy)
+        hk.mixed_precision.set_policy(hk.Conv2D, policy)
+        hk.mixed_precision.set_policy(hk.Linear, policy)
+        # Normalization statistics and Q-values are kept in full precision.
+        full = jmp.get_policy('float32')
+        hk.mixed_precision.set_policy(hk.LayerNorm, full)
+        hk.mixed_precision.set_policy(hk.RMSNorm, full)
+        hk.mixed_precision.set_policy(QHead, full)
 
         @hk.without_apply_rng
         @hk.multi_transform
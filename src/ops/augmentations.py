@@ -9,18 +9,20 @@ def random_crop(rng: chex.PRNGKey,
                 img: chex.Array,
                 crop_size: int
                 ) -> chex.Array:
-    """Crop HW dims preserving original shape via padding."""
+    """Crop HW dims preserving original shape via edge padding.
+
+    Padding is never materialized: shifted indices are clipped
+    to the image borders and gathered in a single pass.
+    """
     chex.assert_scalar_positive(crop_size)
     chex.assert_type(img, jnp.uint8)
     chex.assert_rank(img, 3)
 
-    pad = (crop_size, crop_size)
-    nopad = (0, 0)
-    pad_with = 2 * (pad,) + (nopad,)
-    crop = jax.random.randint(rng, (2,), 0, 2 * crop_size + 1)
-    crop = jnp.concatenate([crop, jnp.zeros(1)], dtype=jnp.int32)
-    padded = jnp.pad(img, pad_with, mode='edge')
-    return jax.lax.dynamic_slice(padded, crop, img.shape)
+    height, width, _ = img.shape
+    dy, dx = jax.random.randint(rng, (2,), -crop_size, crop_size + 1)
+    ys = jnp.clip(jnp.arange(height) + dy, 0, height - 1)
+    xs = jnp.clip(jnp.arange(width) + dx, 0, width - 1)
+    return img[ys[:, None], xs[None, :]]
 
 
 def batched_random_crop(rng: chex.PRNGKey,
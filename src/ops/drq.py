@@ -13,7 +13,7 @@ from src.ops.tb_lambda import tree_backup
 from src import types_ as types
 
 
-def drq(cfg: CoderConfig, networks: CoderNetworks) -> types.StepFn:
+def drq(cfg: CoderConfig, networks: CoderNetworks) -> types.MultiStepFn:
 
     def loss_fn(params: hk.Params,
                 target_params: hk.Params,
@@ -31,8 +31,9 @@ def drq(cfg: CoderConfig, networks: CoderNetworks) -> types.StepFn:
         TIME_DIM, BATCH_DIM, ACT_DIM, QS_DIM = range(4)
 
         def select_actions(q_values, actions):
-            select = hk.BatchApply(jax.vmap(lambda q, a: q[a]))
-            return select(q_values, actions)
+            actions = jnp.expand_dims(actions, (ACT_DIM, QS_DIM))
+            q_values = jnp.take_along_axis(q_values, actions, ACT_DIM)
+            return jnp.squeeze(q_values, ACT_DIM)
 
         tc_aug = jax.vmap(  # time consistent augmentation
             augmentation_fn, in_axes=(None, TIME_DIM, None), out_axes=TIME_DIM)
@@ -73,9 +74,14 @@ def drq(cfg: CoderConfig, networks: CoderNetworks) -> types.StepFn:
         metrics = jax.tree_util.tree_map(jnp.mean, metrics)
         return critic_loss, metrics
 
+    def grad_norms(grad: hk.Params) -> tuple[jax.Array, jax.Array]:
+        encoder_grad, _, critic_grad = networks.split_params(grad)
+        return optax.global_norm(encoder_grad), optax.global_norm(critic_grad)
+
     @chex.assert_max_traces(1)
     def step(state: TrainingState,
-             batch: types.Trajectory
+             batch: types.Trajectory,
+             log_grads: bool | jax.Array = True
              ) -> tuple[TrainingState, types.Metrics]:
         """Single batch step."""
         print('Tracing DrQ step.')
@@ -91,11 +97,40 @@ def drq(cfg: CoderConfig, networks: CoderNetworks) -> types.StepFn:
         grad, metrics = grad_fn(params, target_params, subkey, *args)
 
         state = state.update(grad)
-        encoder_gn, _, critic_gn = map(
-            optax.global_norm,
-            networks.split_params(grad)
+        encoder_gn, critic_gn = jax.lax.cond(
+            log_grads,
+            grad_norms,
+            lambda _: (jnp.float32(0), jnp.float32(0)),
+            grad
         )
         metrics.update(encoder_grad_norm=encoder_gn, critic_grad_norm=critic_gn)
         return state.replace(rng=rng), metrics
 
-    return step
+    def multi_step(state: TrainingState,
+                   batches: types.Trajectory,
+                   log: bool | jax.Array = True
+                   ) -> tuple[TrainingState, types.Metrics]:
+        """Sequential steps over the leading axis of stacked batches.
+
+        Only the last step metrics are returned, so grad norms
+        are computed there and only if they are going to be logged.
+        """
+        num_steps = jax.tree_util.tree_leaves(batches)[0].shape[0]
+        if not cfg.jit:
+            # Eager updates to keep the step debuggable.
+            for i in range(num_steps):
+                batch = jax.tree_util.tree_map(lambda t: t[i], batches)
+                log_grads = jnp.logical_and(i == num_steps - 1, log)
+                state, metrics = step(state, batch, log_grads)
+            return state, metrics
+
+        log_grads = jnp.logical_and(jnp.arange(num_steps) == num_steps - 1, log)
+        state, metrics = jax.lax.scan(
+            lambda state_, xs: step(state_, *xs),
+            state,
+            (batches, log_grads)
+        )
+        metrics = jax.tree_util.tree_map(lambda t: t[-1], metrics)
+        return state, metrics
+
+    return multi_step
@@ -43,15 +43,18 @@ class ReplayBuffer:
         self._len = max(self._len, self._idx)
         self._idx %= self.capacity
 
+    def sample(self, batch_size: int | Shape) -> Nested[np.ndarray]:
+        idx = self._rng.integers(0, self._len, batch_size)
+        batch = [x[idx] for x in self._memory]
+        return self._treedef.unflatten(batch)
+
     def as_generator(self,
-                     batch_size: int
+                     batch_size: int | Shape
                      ) -> typing.Generator[Nested[np.ndarray], None, None]:
         while True:
-            idx = self._rng.integers(0, self._len, batch_size)
-            batch = tree_util.tree_map(lambda x: x[idx], self._memory)
-            yield self._treedef.unflatten(batch)
+            yield self.sample(batch_size)
 
-    def as_tfdataset(self, batch_size: int) -> 'tf.data.Dataset':
+    def as_tfdataset(self, batch_size: int | Shape) -> 'tf.data.Dataset':
         import tensorflow as tf
         try:
             tf.config.set_visible_devices([], 'GPU')
@@ -88,17 +91,19 @@ class ReplayBuffer:
 
     @staticmethod
     def tile_signature(signature: Nested[SpecsLike],
-                       reps: int | Nested[int],
+                       reps: int | Shape | Nested[int],
                        constructor: typing.Callable[[Shape, type], SpecsLike]
                                     | None = None
                        ) -> Nested[SpecsLike]:
-        if isinstance(reps, int):
-            reps = tree_util.tree_map(lambda _: reps, signature)
+        if isinstance(reps, int | tuple):
+            prefix = reps
+            reps = tree_util.tree_map(lambda _: prefix, signature)
         else:
             struct = tree_util.tree_structure
             assert struct(signature) == struct(reps)
 
         def tile_fn(sp, p):
             ctor = constructor or type(sp)
-            return ctor((p,) + sp.shape, sp.dtype)
+            prefix = (p,) if isinstance(p, int) else p
+            return ctor(prefix + sp.shape, sp.dtype)
         return tree_util.tree_map(tile_fn, signature, reps)
@@ -91,7 +91,7 @@ class Runner:
                                    c.byol_targets_update)
         step = ops.byol(c, networks)
         if c.jit:
-            step = jax.jit(step)
+            step = jax.jit(step, donate_argnums=0)
         logger = TFSummaryLogger(self.exp_path(), 'byol', 'step')
 
         for t in range(c.byol_steps):
@@ -133,7 +133,7 @@ class Runner:
         act = networks.act
         if c.jit:
             act = jax.jit(act)
-            step = jax.jit(step)
+            step = jax.jit(step, donate_argnums=0)
 
         logger = TFSummaryLogger(self.exp_path(), 'drq', step_key='step')
         replay_path = self.exp_path(Runner.REPLAY)
@@ -161,19 +161,17 @@ class Runner:
             if agent_ds is None:
                 demo_batch = int(c.demo_fraction * c.drq_batch_size)
                 agent_batch = c.drq_batch_size - demo_batch
-                agent_ds = replay.as_tfdataset(agent_batch)
-                demo_ds = demo.as_tfdataset(demo_batch)
+                agent_ds = replay.as_tfdataset((c.utd, agent_batch))
+                demo_ds = demo.as_tfdataset((c.utd, demo_batch))
                 print('Training.')
-            for _ in range(c.utd):
-                agent_batch = next(agent_ds)
-                demo_batch = next(demo_ds)
-                batch = jax.tree_util.tree_map(
-                    lambda t1, t2: np.concatenate([t1, t2]),
-                    agent_batch, demo_batch
-                )
-                batch = jax.device_put(batch)
-                state, metrics = step(state, batch)
-            if num_episodes % c.log_every == 0:
+            batches = jax.tree_util.tree_map(
+                lambda t1, t2: np.concatenate([t1, t2], 1),
+                next(agent_ds), next(demo_ds)
+            )
+            batches = jax.device_put(batches)
+            log = num_episodes % c.log_every == 0
+            state, metrics = step(state, batches, log)
+            if log:
                 metrics.update(step=num_episodes * c.time_limit,
                                time=time.time() - start,
                                score_wma100=np.mean(scores),
@@ -1,4 +1,4 @@
-from typing import NamedTuple
+from typing import Callable, NamedTuple
 
 import jax
 import jax.numpy as jnp
@@ -21,19 +21,13 @@ class TrainingState(NamedTuple):
         target_params = self.target_params
         opt_state = self.opt_state
         step = self.step
+        assert step.shape == () and step.dtype == jnp.int32, step
+
+        target_update_fn = _make_target_update_fn(self.target_update_var)
 
         updates, opt_state = self.tx(grad, opt_state, params)
-        params = optax.apply_updates(params, updates)
-        if (tv := self.target_update_var) > 0:
-            match tv:
-                case int():
-                    target_params = optax.periodic_update(
-                        params, target_params, step, tv)
-                case float():
-                    target_params = optax.incremental_update(
-                        params, target_params, tv)
-                case _:
-                    raise NotImplementedError(tv)
+        params, target_params = target_update_fn(
+            params, updates, target_params, step)
 
         return self._replace(
             params=params,
@@ -51,7 +45,8 @@ class TrainingState(NamedTuple):
              ) -> 'TrainingState':
         return cls(
             params=params,
-            target_params=params,
+            # Distinct buffers so the state can be donated to jit.
+            target_params=jax.tree_util.tree_map(jnp.copy, params),
             opt_state=optim.init(params),
             rng=rng,
             step=jnp.int32(0),
@@ -75,3 +70,41 @@ class TrainingState(NamedTuple):
     @classmethod
     def tree_unflatten(cls, aux, children):
         return cls(*children, *aux)
+
+
+def _make_target_update_fn(target_update_var: float | int) -> Callable:
+    """Resolve the target network update rule at trace time.
+
+    Returned function applies optimizer updates to the params and
+    then updates the target params accordingly.
+    """
+    match target_update_var:
+        case int() as period if period > 0:
+            def update_fn(params, updates, target_params, step):
+                params = optax.apply_updates(params, updates)
+                target_params = optax.periodic_update(
+                    params, target_params, step, period)
+                return params, target_params
+        case float() as tau if tau > 0:
+            def update_fn(params, updates, target_params, step):
+                del step
+
+                # Single sweep over the leaves for both outputs.
+                def fused(p, u, tp):
+                    p = jnp.asarray(p + u).astype(p.dtype)
+                    return p, (1. - tau) * tp + tau * p
+
+                out = jax.tree_util.tree_map(
+                    fused, params, updates, target_params)
+                return jax.tree_util.tree_transpose(
+                    jax.tree_util.tree_structure(params),
+                    jax.tree_util.tree_structure((0, 0)),
+                    out
+                )
+        case int() | float():
+            def update_fn(params, updates, target_params, step):
+                del step
+                return optax.apply_updates(params, updates), target_params
+        case _:
+            raise NotImplementedError(target_update_var)
+    return update_fn
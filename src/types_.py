@@ -28,3 +28,6 @@ class Trajectory(TypedDict):
 Layers = collections.abc.Sequence[int]
 Metrics = collections.abc.MutableMapping[str, jnp.number]
 StepFn = Callable[[TrainingState, Trajectory], tuple[TrainingState, Metrics]]
+# Stacked batches along the leading axis and whether to log grad norms.
+MultiStepFn = Callable[[TrainingState, Trajectory, bool],
+                       tuple[TrainingState, Metrics]]